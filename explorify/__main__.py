@@ -24,4 +24,8 @@ from explorify.container import VisualizeContainer
 if __name__ == "__main__":  # pragma: no cover
     container = VisualizeContainer()
     container.init_resources()
-    container.wire(modules=[sys.modules[__name__]], packages=["explorify"])
+    # Only these packages declare @inject consumers; scanning all of explorify is wasted work.
+    container.wire(
+        modules=[sys.modules[__name__]],
+        packages=["explorify.eda.stats.inferential", "explorify.eda.univariate"],
+    )
@@ -27,5 +27,5 @@ from explorify.eda.visualize.visualizer import SeabornCanvas, Visualizer
 # ------------------------------------------------------------------------------------------------ #
 class VisualizeContainer(containers.DeclarativeContainer):
 
-    canvas = providers.Factory(SeabornCanvas)
-    visualizer = providers.Factory(Visualizer, canvas=canvas)
+    canvas = providers.Singleton(SeabornCanvas)
+    visualizer = providers.Singleton(Visualizer, canvas=canvas)
@@ -16,25 +16,41 @@
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
 # ================================================================================================ #
-from abc import ABC
+from __future__ import annotations
 
-import pandas as pd
-from dependency_injector.wiring import Provide, inject
+from abc import ABC
+from typing import TYPE_CHECKING, Optional
 
 from explorify.container import VisualizeContainer
 from explorify.eda.visualize.visualizer import Visualizer
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+_container: Optional[VisualizeContainer] = None
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _default_visualizer() -> Visualizer:
+    """Returns the visualizer Singleton of a container created on first use."""
+    global _container  # noqa: PLW0603
+    if _container is None:
+        _container = VisualizeContainer()
+    return _container.visualizer()
+
 
 # ------------------------------------------------------------------------------------------------ #
 class Analyzer(ABC):
     """Abstract base class for all analyses"""
 
-    @inject
+    __slots__ = ("_data", "_visualizer")
+
     def __init__(
         self,
         data: pd.DataFrame,
-        visualizer: Visualizer = Provide[VisualizeContainer.visualizer],
+        visualizer: Optional[Visualizer] = None,
     ) -> None:
         super().__init__()
         self._data = data
-        self._visualizer = visualizer
+        self._visualizer = visualizer or _default_visualizer()
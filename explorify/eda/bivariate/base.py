@@ -17,20 +17,107 @@
 # Copyright  : (c) 2024 John James                                                                 #
 # ================================================================================================ #
 """Bivariate Base Module"""
+from __future__ import annotations
+
 from abc import abstractmethod
-from typing import Union
+from typing import TYPE_CHECKING, Dict, FrozenSet, Optional, Tuple, Union
 
-import pandas as pd
+import numpy as np
 
 from explorify.eda.base import Analyzer
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# ------------------------------------------------------------------------------------------------ #
+# Column names and per-column numeric flags, as returned by BivariateAnalyzer.prepare.
+ColumnProfile = Tuple[FrozenSet[str], Dict[str, bool]]
+# Cell counts, row levels, column levels and number of observations of a contingency table.
+Contingency = Tuple[np.ndarray, "pd.Index", "pd.Index", int]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _crosstab(
+    a_codes: np.ndarray, a_levels: pd.Index, b_codes: np.ndarray, b_levels: pd.Index
+) -> Contingency:
+    """
+    Counts the co-occurrences of two factorized categorical variables.
+
+    Equivalent to ``pd.crosstab(a, b)`` on the original variables, but the cells are counted
+    with a single ``np.bincount`` over the integer codes, bypassing crosstab's pivot machinery.
+
+    Args:
+        a_codes (np.ndarray): Codes of the variable whose levels form the rows; -1 if missing.
+        a_levels (pd.Index): Sorted levels of the row variable.
+        b_codes (np.ndarray): Codes of the variable whose levels form the columns; -1 if missing.
+        b_levels (pd.Index): Sorted levels of the column variable.
+
+    Returns:
+        Contingency: The counts, the sorted row and column levels, and the number of
+            observations counted.
+    """
+    shape = (len(a_levels), len(b_levels))
+    observed = (a_codes >= 0) & (b_codes >= 0)
+    complete = observed.all()
+    if not complete:
+        a_codes, b_codes = a_codes[observed], b_codes[observed]
+
+    # The flat cell index is widened so that large tables cannot overflow the narrow codes.
+    flat = a_codes.astype(np.intp) * shape[1] + b_codes
+    counts = np.bincount(flat, minlength=shape[0] * shape[1])
+    # No cell can exceed the row count, so int32 suffices for any frame under 2**31 rows
+    # and halves the memory traffic of the statistics computed from the table.
+    counts = counts.reshape(shape).astype(
+        np.int32 if len(a_codes) < 2**31 else np.int64
+    )
+    if not complete:
+        # Levels seen only alongside a missing value are dropped, as pd.crosstab does.
+        rows, cols = counts.any(axis=1), counts.any(axis=0)
+        counts, a_levels, b_levels = (
+            counts[rows][:, cols],
+            a_levels[rows],
+            b_levels[cols],
+        )
+
+    # The table is shared by every caller of the cache, so it must not be modified in place.
+    counts.flags.writeable = False
+    return counts, a_levels, b_levels, len(a_codes)
+
 
 # ------------------------------------------------------------------------------------------------ #
 class BivariateAnalyzer(Analyzer):  # pragma: no cover
     """Abstract base class for bivariate analyses"""
 
-    def __init__(self, data: pd.DataFrame) -> None:
+    __slots__ = ("_columns", "_is_numeric")
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        precomputed: Optional[ColumnProfile] = None,
+    ) -> None:
         super().__init__(data=data)
+        # Column membership and dtype are resolved once so that validation is a lookup.
+        self._columns, self._is_numeric = precomputed or self.prepare(data)
+
+    @classmethod
+    def prepare(cls, data: pd.DataFrame) -> ColumnProfile:
+        """
+        Resolves the column set and numeric dtype flags of a DataFrame.
+
+        Pass the result as ``precomputed`` to every analyzer built over the same frame
+        so that a pairwise sweep resolves dtypes once rather than once per analyzer.
+
+        Args:
+            data (pd.DataFrame): The input data containing the variables.
+
+        Returns:
+            ColumnProfile: The column names, and a mapping of column name to whether
+                the column is numeric.
+        """
+        # The dtype kind agrees with pd.api.types.is_numeric_dtype, numpy and extension
+        # dtypes alike, without going through pandas' dtype dispatch.
+        is_numeric = {c: dtype.kind in "biufc" for c, dtype in data.dtypes.items()}
+        return frozenset(data.columns), is_numeric
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -54,14 +141,21 @@ class BivariateCategoricalNumericAnalyzer(BivariateAnalyzer):  # pragma: no cove
             Abstract method to conduct the analysis for the class.
     """
 
-    def __init__(self, data: pd.DataFrame) -> None:
+    __slots__ = ()
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        precomputed: Optional[ColumnProfile] = None,
+    ) -> None:
         """
         Initializes the BivariateCategoricalNumericAnalyzer instance.
 
         Args:
             data (pd.DataFrame): The input data containing the variables.
+            precomputed (ColumnProfile): Output of ``prepare`` for ``data``. Optional.
         """
-        super().__init__(data=data)
+        super().__init__(data=data, precomputed=precomputed)
 
     def validate_input(self, a_name: str, b_name: str) -> None:
         """
@@ -74,15 +168,15 @@ class BivariateCategoricalNumericAnalyzer(BivariateAnalyzer):  # pragma: no cove
         Raises:
             ValueError: If the input variables are not in the DataFrame or are not of the correct type.
         """
-        if a_name not in self._data.columns or b_name not in self._data.columns:
+        if a_name not in self._columns or b_name not in self._columns:
             raise ValueError(
                 f"Variables '{a_name}' and/or '{b_name}' are not in the DataFrame."
             )
 
-        if pd.api.types.is_numeric_dtype(self._data[a_name]):
+        if self._is_numeric[a_name]:
             raise ValueError(f"Variable '{a_name}' is not categorical.")
 
-        if not pd.api.types.is_numeric_dtype(self._data[b_name]):
+        if not self._is_numeric[b_name]:
             raise ValueError(f"Variable '{b_name}' is not numeric.")
 
     @abstractmethod
@@ -122,14 +216,76 @@ class BivariateCategoricalAnalyzer(BivariateAnalyzer):  # pragma: no cover
 
     """
 
-    def __init__(self, data: pd.DataFrame) -> None:
+    __slots__ = ("_codes_cache", "_contingency_cache")
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        precomputed: Optional[ColumnProfile] = None,
+    ) -> None:
         """
         Initializes the BivariateCategoricalAnalyzer instance.
 
         Args:
             data (pd.DataFrame): The input data containing the variables.
+            precomputed (ColumnProfile): Output of ``prepare`` for ``data``. Optional.
         """
-        super().__init__(data=data)
+        super().__init__(data=data, precomputed=precomputed)
+        self._codes_cache: Dict[str, Tuple[np.ndarray, pd.Index]] = {}
+        self._contingency_cache: Dict[Tuple[str, str], Contingency] = {}
+
+    def _codes(self, name: str) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Returns the integer codes and sorted levels of a variable, factorizing it on first use.
+
+        Every pair a variable takes part in shares the one factorization, so a sweep over
+        pairs hashes each column once rather than once per pair.
+
+        Parameters
+        ----------
+        name : str
+            The name of the variable.
+
+        Returns
+        -------
+        Tuple[np.ndarray, pd.Index]
+            The codes, -1 where the value is missing, and the sorted levels. Sorted codes are
+            the dense ranks of an ordinal variable.
+        """
+        if name not in self._codes_cache:
+            codes, levels = self._data[name].factorize(sort=True)
+            # Codes are stored in the narrowest signed type that holds every level, usually
+            # int8, to cut the memory traffic of the scans that build the tables.
+            for dtype in (np.int8, np.int16, np.int32):
+                if len(levels) <= np.iinfo(dtype).max:
+                    codes = codes.astype(dtype)
+                    break
+            self._codes_cache[name] = codes, levels
+        return self._codes_cache[name]
+
+    def _contingency(self, a_name: str, b_name: str) -> Contingency:
+        """
+        Returns the contingency table of two variables, computing it on first use.
+
+        Parameters
+        ----------
+        a_name : str
+            The name of the variable whose levels form the rows.
+        b_name : str
+            The name of the variable whose levels form the columns.
+
+        Returns
+        -------
+        Contingency
+            The read-only counts, the sorted row and column levels, and the number of
+            observations counted.
+        """
+        key = (a_name, b_name)
+        if key not in self._contingency_cache:
+            self._contingency_cache[key] = _crosstab(
+                *self._codes(a_name), *self._codes(b_name)
+            )
+        return self._contingency_cache[key]
 
     def validate_input(self, a_name: str, b_name: str) -> None:
         """
@@ -147,15 +303,15 @@ class BivariateCategoricalAnalyzer(BivariateAnalyzer):  # pragma: no cover
         ValueError
             If the input variables are not in the DataFrame or are numeric.
         """
-        if a_name not in self._data.columns or b_name not in self._data.columns:
+        if a_name not in self._columns or b_name not in self._columns:
             raise ValueError(
                 f"Variables '{a_name}' and/or '{b_name}' are not in the DataFrame."
             )
 
-        if pd.api.types.is_numeric_dtype(self._data[a_name]):
+        if self._is_numeric[a_name]:
             raise ValueError(f"Variable '{a_name}' is numeric and not categorical.")
 
-        if pd.api.types.is_numeric_dtype(self._data[b_name]):
+        if self._is_numeric[b_name]:
             raise ValueError(f"Variable '{b_name}' is numeric and not categorical.")
 
     @abstractmethod
@@ -197,14 +353,21 @@ class BivariateNumericAnalyzer(BivariateAnalyzer):  # pragma: no cover
 
     """
 
-    def __init__(self, data: pd.DataFrame) -> None:
+    __slots__ = ()
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        precomputed: Optional[ColumnProfile] = None,
+    ) -> None:
         """
         Initializes the BivariateNumericAnalyzer instance.
 
         Args:
             data (pd.DataFrame): The input data containing the variables.
+            precomputed (ColumnProfile): Output of ``prepare`` for ``data``. Optional.
         """
-        super().__init__(data=data)
+        super().__init__(data=data, precomputed=precomputed)
 
     def validate_input(self, a_name: str, b_name: str) -> None:
         """
@@ -222,15 +385,15 @@ class BivariateNumericAnalyzer(BivariateAnalyzer):  # pragma: no cover
         ValueError
             If the input variables are not in the DataFrame or are numeric.
         """
-        if a_name not in self._data.columns or b_name not in self._data.columns:
+        if a_name not in self._columns or b_name not in self._columns:
             raise ValueError(
                 f"Variables '{a_name}' and/or '{b_name}' are not in the DataFrame."
             )
 
-        if not pd.api.types.is_numeric_dtype(self._data[a_name]):
+        if not self._is_numeric[a_name]:
             raise ValueError(f"Variable '{a_name}' is not numeric.")
 
-        if not pd.api.types.is_numeric_dtype(self._data[b_name]):
+        if not self._is_numeric[b_name]:
             raise ValueError(f"Variable '{b_name}' is not numeric.")
 
     @abstractmethod
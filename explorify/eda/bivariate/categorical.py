@@ -17,12 +17,310 @@
 # Copyright  : (c) 2024 John James                                                                 #
 # ================================================================================================ #
 """Module for Categorical Analyzer"""
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
 import numpy as np
 import pandas as pd
-from scipy import stats
-from sklearn.metrics import mutual_info_score
 
-from explorify.eda.bivariate.base import BivariateCategoricalAnalyzer
+from explorify.eda.bivariate.base import (
+    BivariateCategoricalAnalyzer,
+    ColumnProfile,
+    Contingency,
+)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                CONTINGENCY STATISTICS                                            #
+# ------------------------------------------------------------------------------------------------ #
+def _chi2(counts: np.ndarray) -> float:
+    """
+    Computes Pearson's chi-squared statistic of a contingency table.
+
+    Matches the statistic returned by ``scipy.stats.chi2_contingency`` with its default
+    settings, including Yates' continuity correction when there is one degree of freedom,
+    without computing the p-value and the other outputs that are not used here.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Contingency table whose rows and columns all have at least one observation.
+
+    Returns
+    -------
+    float
+        Chi-squared statistic, NaN for an empty table.
+    """
+    observed = counts.astype(np.float64)
+    n = observed.sum()
+    if n == 0:
+        # No complete observations, e.g. an all-missing variable: nothing to measure.
+        return np.nan
+    row_totals = observed.sum(axis=1)
+    col_totals = observed.sum(axis=0)
+    expected = np.multiply.outer(row_totals, col_totals) / n
+    diff = observed - expected
+    if (counts.shape[0] - 1) * (counts.shape[1] - 1) == 1:
+        # Yates' correction shrinks each deviation towards zero by at most 0.5.
+        diff = np.sign(diff) * np.maximum(np.abs(diff) - 0.5, 0.0)
+    return float((diff * diff / expected).sum())
+
+
+def _phi(counts: np.ndarray, correction: bool = True) -> float:
+    """
+    Computes the Phi coefficient of a 2x2 contingency table in closed form.
+
+    Equal to ``sqrt(chi2 / n)`` with the chi-squared statistic of ``_chi2``, computed from
+    the four cell counts without forming expected frequencies.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        A 2x2 contingency table.
+    correction : bool, optional
+        Whether to apply Yates' continuity correction. Defaults to True.
+
+    Returns
+    -------
+    float
+        Phi coefficient.
+    """
+    (a, b), (c, d) = counts.tolist()
+    n = a + b + c + d
+    deviation = abs(a * d - b * c)
+    if correction:
+        # Yates' correction shrinks |ad - bc| by n / 2, to no less than zero.
+        deviation = max(deviation - n / 2, 0.0)
+    return np.float64(deviation) / np.sqrt(
+        np.float64(a + b) * (c + d) * (a + c) * (b + d)
+    )
+
+
+def _contingency_coefficient(chi2: float, n: int) -> float:
+    """
+    Computes Pearson's contingency coefficient, ``sqrt(chi2 / (chi2 + n))``.
+
+    Parameters
+    ----------
+    chi2 : float
+        Chi-squared statistic of the contingency table.
+    n : int
+        Number of observations in the table.
+
+    Returns
+    -------
+    float
+        Contingency coefficient, NaN for an empty table.
+    """
+    if n == 0:
+        return np.nan
+    return np.sqrt(chi2 / (chi2 + n))
+
+
+def _cramers_v(chi2: float, n: int, shape: Tuple[int, int]) -> float:
+    """
+    Computes Cramer's V, ``sqrt(chi2 / (n * (min(r, k) - 1)))``.
+
+    Parameters
+    ----------
+    chi2 : float
+        Chi-squared statistic of the contingency table.
+    n : int
+        Number of observations in the table.
+    shape : Tuple[int, int]
+        Shape of the contingency table.
+
+    Returns
+    -------
+    float
+        Cramer's V, NaN for an empty table or when either variable has a single level.
+    """
+    dim = min(shape) - 1
+    if n == 0 or dim < 1:
+        return np.nan
+    return np.sqrt(chi2 / (n * dim))
+
+
+def _lambda_nominal(chi2: float, n: int, shape: Tuple[int, int]) -> float:
+    """
+    Computes the lambda coefficient of two nominal variables, ``sqrt(chi2 / (n * min(r, k)))``.
+
+    Parameters
+    ----------
+    chi2 : float
+        Chi-squared statistic of the contingency table.
+    n : int
+        Number of observations in the table.
+    shape : Tuple[int, int]
+        Shape of the contingency table.
+
+    Returns
+    -------
+    float
+        Lambda coefficient, NaN for an empty table.
+    """
+    if n == 0:
+        return np.nan
+    return np.sqrt(chi2 / (n * min(shape)))
+
+
+def _cramers_v_corrected(chi2: float, n: int, shape: Tuple[int, int]) -> float:
+    """
+    Computes Bergsma's bias-corrected Cramer's V from a chi-squared statistic.
+
+    Parameters
+    ----------
+    chi2 : float
+        Chi-squared statistic of the contingency table.
+    n : int
+        Number of observations in the table.
+    shape : Tuple[int, int]
+        Shape of the contingency table.
+
+    Returns
+    -------
+    float
+        Bias-corrected Cramer's V, NaN when it is undefined for the table.
+    """
+    if n < 2:
+        return np.nan
+    r, k = shape
+    phi2 = max(0.0, chi2 / n - (r - 1) * (k - 1) / (n - 1))
+    r_corrected = r - (r - 1) ** 2 / (n - 1)
+    k_corrected = k - (k - 1) ** 2 / (n - 1)
+    dim = min(r_corrected, k_corrected) - 1
+    return np.sqrt(phi2 / dim) if dim > 0 else np.nan
+
+
+def _theils_u(counts: np.ndarray) -> float:
+    """
+    Computes Theil's U, the uncertainty coefficient U(column | row), from a contingency table.
+
+    The share of the entropy of the column variable that is explained by the row variable,
+    ``I(row; column) / H(column)``, between 0 (independent) and 1 (fully determined).
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Contingency table with the nominal variable on the rows.
+
+    Returns
+    -------
+    float
+        Theil's U coefficient, NaN for an empty table.
+    """
+    col_totals = counts.sum(axis=0)
+    n = col_totals.sum()
+    if n == 0:
+        # An empty table has zero entropy too, but nothing was observed to explain.
+        return np.nan
+    p_y = col_totals[col_totals > 0] / n
+    entropy = -(p_y * np.log(p_y)).sum()
+    if entropy == 0:
+        # A constant column variable leaves no uncertainty to explain.
+        return 1.0
+    return min(_mutual_information(counts) / entropy, 1.0)
+
+
+def _mutual_information(counts: np.ndarray) -> float:
+    """
+    Computes the mutual information, in nats, of the variables of a contingency table.
+
+    Matches ``sklearn.metrics.mutual_info_score`` given the same table, without re-encoding
+    the table as a sparse matrix.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Contingency table of the two variables.
+
+    Returns
+    -------
+    float
+        Mutual information score, NaN for an empty table.
+    """
+    if counts.sum() == 0:
+        return np.nan
+    if min(counts.shape) < 2:
+        # A variable with a single observed level carries no information about the other.
+        return 0.0
+    observed = counts > 0
+    n_ij = counts[observed].astype(np.float64)
+    n = n_ij.sum()
+    row_totals = np.broadcast_to(counts.sum(axis=1, keepdims=True), counts.shape)
+    col_totals = np.broadcast_to(counts.sum(axis=0, keepdims=True), counts.shape)
+    outer = row_totals[observed].astype(np.float64) * col_totals[observed]
+
+    mi = (n_ij / n) * (np.log(n_ij) + np.log(n) - np.log(outer))
+    # Rounding can leave a tiny negative score for independent variables.
+    return np.maximum(mi.sum(), 0.0)
+
+
+def _gamma_ordinal(counts: np.ndarray) -> float:
+    """
+    Computes Goodman and Kruskal's gamma from a contingency table of two ordinal variables.
+
+    A pair of observations is concordant when it is ordered the same way on both variables and
+    discordant when it is ordered oppositely; pairs tied on either variable are ignored. Each
+    cell is weighed against the cells strictly below and to its right (or left), so the count
+    takes O(r * c) rather than O(n^2) time.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Contingency table with rows and columns in ascending order of their levels.
+
+    Returns
+    -------
+    float
+        Gamma coefficient.
+    """
+    n = counts.astype(np.int64)
+    # below[i, j] counts the observations in column j of the rows after row i.
+    below = np.zeros_like(n)
+    below[:-1] = np.cumsum(n[::-1], axis=0)[::-1][1:]
+    right = np.zeros_like(n)
+    right[:, :-1] = np.cumsum(below[:, ::-1], axis=1)[:, ::-1][:, 1:]
+    left = np.zeros_like(n)
+    left[:, 1:] = np.cumsum(below, axis=1)[:, :-1]
+
+    concordant_pairs = int((n * right).sum())
+    discordant_pairs = int((n * left).sum())
+    return (concordant_pairs - discordant_pairs) / (concordant_pairs + discordant_pairs)
+
+
+def _gamma_mixed(counts: np.ndarray) -> float:
+    """
+    Computes the gamma coefficient from a contingency table of an ordinal and a nominal variable.
+
+    Pairs of observations at different ordinal levels are compared by the table counts at their
+    crossed cells. A pair only depends on the two cells its observations fall in, so pairs are
+    counted per pair of cells, weighted by the cell counts.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Contingency table with the ordinal variable on the rows, in ascending order.
+
+    Returns
+    -------
+    float
+        Gamma coefficient.
+    """
+    n = counts.astype(np.int64)
+    row_totals = n.sum(axis=1)
+    total = int(row_totals.sum())
+    # Pairs of observations at different ordinal levels.
+    pairs = (total * total - int((row_totals * row_totals).sum())) // 2
+
+    concordant_pairs = 0
+    for p in range(n.shape[0] - 1):
+        later = n[p + 1 :]
+        # Cells (p, q) and (r, s), r > p, are concordant when n[r, q] > n[p, s].
+        concordant = later[:, :, None] > n[p][None, None, :]
+        concordant_pairs += int(np.einsum("q,rs,rqs->", n[p], later, concordant))
+    discordant_pairs = pairs - concordant_pairs
+
+    return (concordant_pairs - discordant_pairs) / (concordant_pairs + discordant_pairs)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -48,7 +346,9 @@ class ContingencyTableAnalyzer(BivariateCategoricalAnalyzer):
         Computes the contingency table for the specified categorical variables.
     """
 
-    def __init__(self, data: pd.DataFrame):
+    __slots__ = ()
+
+    def __init__(self, data: pd.DataFrame, precomputed: Optional[ColumnProfile] = None):
         """
         Initializes the ContingencyTableAnalyzer instance.
 
@@ -56,8 +356,10 @@ class ContingencyTableAnalyzer(BivariateCategoricalAnalyzer):
         ----------
         data : pd.DataFrame
             The input data containing the variables.
+        precomputed : ColumnProfile, optional
+            Output of ``prepare`` for ``data``.
         """
-        super().__init__(data)
+        super().__init__(data, precomputed=precomputed)
 
     def analyze(self, a_name: str, b_name: str) -> pd.DataFrame:
         """
@@ -76,7 +378,12 @@ class ContingencyTableAnalyzer(BivariateCategoricalAnalyzer):
             Contingency table of the two variables.
         """
         self.validate_input(a_name, b_name)
-        return pd.crosstab(self._data[a_name], self._data[b_name])
+        counts, a_levels, b_levels, _ = self._contingency(a_name, b_name)
+        return pd.DataFrame(
+            counts.astype(np.int64),
+            index=a_levels.rename(a_name),
+            columns=b_levels.rename(b_name),
+        )
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -104,7 +411,9 @@ class MutualInformationAnalyzer(BivariateCategoricalAnalyzer):
         Computes the mutual information score between the specified categorical variables.
     """
 
-    def __init__(self, data: pd.DataFrame):
+    __slots__ = ()
+
+    def __init__(self, data: pd.DataFrame, precomputed: Optional[ColumnProfile] = None):
         """
         Initializes the MutualInformationAnalyzer instance.
 
@@ -112,8 +421,10 @@ class MutualInformationAnalyzer(BivariateCategoricalAnalyzer):
         ----------
         data : pd.DataFrame
             The input data containing the variables.
+        precomputed : ColumnProfile, optional
+            Output of ``prepare`` for ``data``.
         """
-        super().__init__(data)
+        super().__init__(data, precomputed=precomputed)
 
     def analyze(
         self, a_name: str, b_name: str, a_type: str = "nominal", b_type: str = "nominal"
@@ -138,18 +449,10 @@ class MutualInformationAnalyzer(BivariateCategoricalAnalyzer):
             Mutual information score between the two variables.
         """
         self.validate_input(a_name=a_name, b_name=b_name)
-        # Assign ranks to the ordinal values
-        if a_type == "ordinal":
-            a_data = self._data[a_name].rank(method="dense")
-        else:
-            a_data = self._data[a_name]
-        if b_type == "ordinal":
-            b_data = self._data[b_name].rank(method="dense")
-        else:
-            b_data = self._data[b_name]
-
-        self.validate_input(a_name, b_name)
-        return mutual_info_score(a_data, b_data)
+        # Mutual information depends only on which levels co-occur, so ranking ordinal
+        # values would relabel the levels without changing the score.
+        counts, _, _, _ = self._contingency(a_name, b_name)
+        return _mutual_information(counts)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -171,11 +474,13 @@ class PhiCoefficientAnalyzer(BivariateCategoricalAnalyzer):
     __init__(self, data: pd.DataFrame):
         Initializes the PhiCoefficientAnalyzer instance.
 
-    analyze(self, a_name: str, b_name: str) -> float:
+    analyze(self, a_name: str, b_name: str, correction: bool = True) -> float:
         Computes the Phi coefficient for the specified nominal variables.
     """
 
-    def __init__(self, data: pd.DataFrame):
+    __slots__ = ()
+
+    def __init__(self, data: pd.DataFrame, precomputed: Optional[ColumnProfile] = None):
         """
         Initializes the PhiCoefficientAnalyzer instance.
 
@@ -183,10 +488,12 @@ class PhiCoefficientAnalyzer(BivariateCategoricalAnalyzer):
         ----------
         data : pd.DataFrame
             The input data containing the variables.
+        precomputed : ColumnProfile, optional
+            Output of ``prepare`` for ``data``.
         """
-        super().__init__(data)
+        super().__init__(data, precomputed=precomputed)
 
-    def analyze(self, a_name: str, b_name: str) -> float:
+    def analyze(self, a_name: str, b_name: str, correction: bool = True) -> float:
         """
         Computes the Phi coefficient for two nominal variables (for 2x2 tables).
 
@@ -196,6 +503,9 @@ class PhiCoefficientAnalyzer(BivariateCategoricalAnalyzer):
             The name of the first nominal variable.
         b_name : str
             The name of the second nominal variable.
+        correction : bool, optional
+            Whether to apply Yates' continuity correction. Defaults to True; pass False
+            for the classical, uncorrected Phi coefficient.
 
         Returns
         -------
@@ -208,16 +518,14 @@ class PhiCoefficientAnalyzer(BivariateCategoricalAnalyzer):
             If the contingency table is not 2x2.
         """
         self.validate_input(a_name, b_name)
-        contingency_table = pd.crosstab(self._data[a_name], self._data[b_name])
+        counts, _, _, _ = self._contingency(a_name, b_name)
 
-        if contingency_table.shape != (2, 2):
+        if counts.shape != (2, 2):
             raise ValueError(
                 "Phi coefficient can only be computed for 2x2 contingency tables."
             )
 
-        chi2, _, _, _ = stats.chi2_contingency(contingency_table)
-        n = self._data.shape[0]
-        return np.sqrt(chi2 / n)
+        return _phi(counts, correction=correction)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -243,7 +551,9 @@ class ContingencyCoefficientAnalyzer(BivariateCategoricalAnalyzer):
         Computes the contingency coefficient for the specified nominal variables.
     """
 
-    def __init__(self, data: pd.DataFrame):
+    __slots__ = ()
+
+    def __init__(self, data: pd.DataFrame, precomputed: Optional[ColumnProfile] = None):
         """
         Initializes the ContingencyCoefficientAnalyzer instance.
 
@@ -251,8 +561,10 @@ class ContingencyCoefficientAnalyzer(BivariateCategoricalAnalyzer):
         ----------
         data : pd.DataFrame
             The input data containing the variables.
+        precomputed : ColumnProfile, optional
+            Output of ``prepare`` for ``data``.
         """
-        super().__init__(data)
+        super().__init__(data, precomputed=precomputed)
 
     def analyze(
         self, a_name: str, b_name: str, a_type: str = "nominal", b_type: str = "nominal"
@@ -288,19 +600,10 @@ class ContingencyCoefficientAnalyzer(BivariateCategoricalAnalyzer):
             If there is an issue with input validation or contingency table computation.
         """
         self.validate_input(a_name=a_name, b_name=b_name)
-        # Sort ordinal variables
-        if a_type == "ordinal":
-            self._data[a_name] = self._data[a_name].sort_values()
-        if b_type == "ordinal":
-            self._data[b_name] = self._data[b_name].sort_values()
-
-        self.validate_input(a_name, b_name)
-        contingency_table = pd.crosstab(self._data[a_name], self._data[b_name])
+        counts, _, _, n = self._contingency(a_name, b_name)
 
         try:
-            chi2, _, _, _ = stats.chi2_contingency(contingency_table)
-            n = self._data.shape[0]
-            return np.sqrt(chi2 / (chi2 + n))
+            return _contingency_coefficient(_chi2(counts), n)
         except ValueError as e:  # pragma: no cover
             raise ValueError("Failed to compute contingency coefficient.") from e
 
@@ -334,7 +637,9 @@ class LambdaCoefficientAnalyzer(BivariateCategoricalAnalyzer):
         Computes the lambda coefficient for a mix of nominal and ordinal variables.
     """
 
-    def __init__(self, data: pd.DataFrame):
+    __slots__ = ()
+
+    def __init__(self, data: pd.DataFrame, precomputed: Optional[ColumnProfile] = None):
         """
         Initializes the LambdaCoefficientAnalyzer instance.
 
@@ -342,8 +647,10 @@ class LambdaCoefficientAnalyzer(BivariateCategoricalAnalyzer):
         ----------
         data : pd.DataFrame
             The input data containing the variables.
+        precomputed : ColumnProfile, optional
+            Output of ``prepare`` for ``data``.
         """
-        super().__init__(data)
+        super().__init__(data, precomputed=precomputed)
 
     def analyze(
         self, a_name: str, b_name: str, a_type: str = "nominal", b_type: str = "nominal"
@@ -394,11 +701,9 @@ class LambdaCoefficientAnalyzer(BivariateCategoricalAnalyzer):
         float
             Lambda coefficient.
         """
-        self.validate_input(a_name, b_name)
-        contingency_table = pd.crosstab(self._data[a_name], self._data[b_name])
-        chi2, _, _, _ = stats.chi2_contingency(contingency_table)
-        n = self._data.shape[0]
-        return np.sqrt(chi2 / (n * min(contingency_table.shape)))
+        counts, _, _, n = self._contingency(a_name, b_name)
+        r, k = counts.shape
+        return _lambda_nominal(_chi2(counts), n, (r, k))
 
     def _analyze_mixed(self, a_name: str, b_name: str) -> float:
         """
@@ -416,29 +721,21 @@ class LambdaCoefficientAnalyzer(BivariateCategoricalAnalyzer):
         float
             Lambda coefficient.
         """
-        self.validate_input(a_name, b_name)
-        contingency_table = pd.crosstab(self._data[a_name], self._data[b_name])
-        n = contingency_table.sum().sum()  # Total number of observations
+        counts, _, _, n = self._contingency(a_name, b_name)
+        if n == 0:
+            # No complete observations, e.g. an all-missing variable: nothing to measure.
+            return np.nan
 
         # Calculate the marginal proportions
-        row_marginals = contingency_table.sum(axis=1) / n
-        col_marginals = contingency_table.sum(axis=0) / n
+        row_marginals = counts.sum(axis=1) / n
+        col_marginals = counts.sum(axis=0) / n
+        marginal_products = np.multiply.outer(row_marginals, col_marginals)
 
         # Calculate the observed agreement
-        observed_agreement = 0
-        for i in range(contingency_table.shape[0]):
-            for j in range(contingency_table.shape[1]):
-                observed_agreement += (
-                    contingency_table.iloc[i, j]
-                    * row_marginals.iloc[i]
-                    * col_marginals.iloc[j]
-                )
+        observed_agreement = np.einsum("ij,ij->", counts, marginal_products)
 
         # Calculate the expected agreement under independence assumption
-        expected_agreement = 0
-        for i in range(contingency_table.shape[0]):
-            for j in range(contingency_table.shape[1]):
-                expected_agreement += row_marginals.iloc[i] * col_marginals.iloc[j]
+        expected_agreement = marginal_products.sum()
 
         return (observed_agreement - expected_agreement) / (1 - expected_agreement)
 
@@ -461,7 +758,9 @@ class GammaCoefficientAnalyzer(BivariateCategoricalAnalyzer):
 
     """
 
-    def __init__(self, data: pd.DataFrame):
+    __slots__ = ()
+
+    def __init__(self, data: pd.DataFrame, precomputed: Optional[ColumnProfile] = None):
         """
         Initializes the GammaCoefficientAnalyzer instance.
 
@@ -469,8 +768,10 @@ class GammaCoefficientAnalyzer(BivariateCategoricalAnalyzer):
         ----------
         data : pd.DataFrame
             The input data containing the variables.
+        precomputed : ColumnProfile, optional
+            Output of ``prepare`` for ``data``.
         """
-        super().__init__(data)
+        super().__init__(data, precomputed=precomputed)
 
     def analyze(
         self, a_name: str, b_name: str, a_type: str = "ordinal", b_type: str = "nominal"
@@ -494,6 +795,11 @@ class GammaCoefficientAnalyzer(BivariateCategoricalAnalyzer):
         float
             Gamma coefficient.
 
+        Notes
+        -----
+        Pairs are counted from the contingency table, so rows missing either variable are
+        left out of the count.
+
         Raises
         ------
         ValueError
@@ -523,33 +829,8 @@ class GammaCoefficientAnalyzer(BivariateCategoricalAnalyzer):
         float
             Gamma coefficient.
         """
-        self.validate_input(a_name, b_name)
-        contingency_table = pd.crosstab(self._data[a_name], self._data[b_name])
-
-        # Sort the ordinal variable
-        a_data = self._data[a_name].sort_values()
-        b_data = self._data[b_name]
-
-        # Compute the ranks for the ordinal variable
-        ranks = a_data.rank(method="dense")
-
-        # Calculate the differences in ranks for concordant and discordant pairs
-        concordant_pairs = 0
-        discordant_pairs = 0
-        for i in range(len(self._data)):
-            for j in range(i + 1, len(self._data)):
-                if a_data[i] != a_data[j]:
-                    if (ranks[i] - ranks[j]) * (
-                        contingency_table.loc[a_data[i], b_data[j]]
-                        - contingency_table.loc[a_data[j], b_data[i]]
-                    ) > 0:
-                        concordant_pairs += 1
-                    else:
-                        discordant_pairs += 1
-
-        return (concordant_pairs - discordant_pairs) / (
-            concordant_pairs + discordant_pairs
-        )
+        counts, _, _, _ = self._contingency(a_name, b_name)
+        return _gamma_mixed(counts)
 
     def _analyze_ordinal(self, a_name: str, b_name: str) -> float:
         """
@@ -567,30 +848,8 @@ class GammaCoefficientAnalyzer(BivariateCategoricalAnalyzer):
         float
             Gamma coefficient.
         """
-        self.validate_input(a_name, b_name)
-
-        # Sort the ordinal variables
-        a_data = self._data[a_name].sort_values()
-        b_data = self._data[b_name].sort_values()
-
-        # Compute the ranks for the ordinal variables
-        ranks_a = a_data.rank(method="dense")
-        ranks_b = b_data.rank(method="dense")
-
-        # Calculate the differences in ranks for concordant and discordant pairs
-        concordant_pairs = 0
-        discordant_pairs = 0
-        for i in range(len(self._data)):
-            for j in range(i + 1, len(self._data)):
-                if a_data[i] != a_data[j] and b_data[i] != b_data[j]:
-                    if (ranks_a[i] - ranks_a[j]) * (ranks_b[i] - ranks_b[j]) > 0:
-                        concordant_pairs += 1
-                    else:
-                        discordant_pairs += 1
-
-        return (concordant_pairs - discordant_pairs) / (
-            concordant_pairs + discordant_pairs
-        )
+        counts, _, _, _ = self._contingency(a_name, b_name)
+        return _gamma_ordinal(counts)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -612,14 +871,17 @@ class ThielsUCoefficientAnalyzer(BivariateCategoricalAnalyzer):
 
     """
 
-    def __init__(self, data: pd.DataFrame):
+    __slots__ = ()
+
+    def __init__(self, data: pd.DataFrame, precomputed: Optional[ColumnProfile] = None):
         """
         Initializes the ThielsUCoefficientAnalyzer instance.
 
         Args:
             data (pd.DataFrame): The input data containing the variables.
+            precomputed (ColumnProfile): Output of ``prepare`` for ``data``. Optional.
         """
-        super().__init__(data=data)
+        super().__init__(data=data, precomputed=precomputed)
 
     def analyze(self, a_name: str, b_name: str) -> float:
         """
@@ -632,19 +894,268 @@ class ThielsUCoefficientAnalyzer(BivariateCategoricalAnalyzer):
                 "0_low_income", "1_moderate_income", etc...
 
         Returns:
-            float: Theil's U coefficient.
+            float: Theil's U coefficient of the ordinal variable given the nominal one,
+                between 0 and 1.
         """
         self.validate_input(a_name, b_name)
 
-        # Calculate the marginal probabilities
-        p_x = self._data[a_name].value_counts(normalize=True)
-        p_y_given_x = self._data.groupby(a_name)[b_name].value_counts(normalize=True)
+        counts, _, _, _ = self._contingency(a_name, b_name)
+        return _theils_u(counts)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                               BATCH CATEGORICAL ANALYSIS                                         #
+# ------------------------------------------------------------------------------------------------ #
+def _pool_rare_levels(
+    codes: np.ndarray, levels: pd.Index, top_k: int
+) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Keeps the ``top_k`` most frequent levels of a factorized variable and pools the rest.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Codes of the variable, -1 where the value is missing.
+    levels : pd.Index
+        Sorted levels of the variable.
+    top_k : int
+        The number of levels to keep.
+
+    Returns
+    -------
+    Tuple[np.ndarray, pd.Index]
+        The remapped codes, and the kept levels in their original order followed by the pooled
+        level. The pooled level is labelled "Other", suffixed with " (pooled)" as often as
+        needed to differ from every kept level.
+    """
+    frequency = np.bincount(codes[codes >= 0], minlength=len(levels))
+    keep = np.sort(np.argsort(-frequency, kind="stable")[:top_k])
+
+    mapping = np.full(len(levels), top_k, dtype=codes.dtype)
+    mapping[keep] = np.arange(top_k, dtype=codes.dtype)
+    pooled = np.where(codes >= 0, mapping[codes], -1).astype(codes.dtype)
+
+    kept = levels[keep]
+    label = "Other"
+    while label in kept:
+        label = f"{label} (pooled)"
+    return pooled, pd.Index([*kept, label])
+
+
+class BatchCategoricalAnalyzer(BivariateCategoricalAnalyzer):
+    """
+    Computes several association measures for many pairs of categorical variables at once.
+
+    Each column is factorized once, each pair's contingency table is built once, and the
+    chi-squared statistic is shared by every measure that needs it.
+
+    Inherits from BivariateCategoricalAnalyzer.
+
+    Attributes
+    ----------
+    _data : pd.DataFrame
+        The input data containing the variables.
+
+    Methods
+    -------
+    __init__(self, data: pd.DataFrame):
+        Initializes the BatchCategoricalAnalyzer instance.
+
+    analyze(self, pairs: Sequence[Tuple[str, str]], metrics: Sequence[str] = METRICS) -> pd.DataFrame:
+        Computes the requested measures for each pair of variables.
+
+    pairwise(self, columns: Sequence[str], metric: str) -> pd.DataFrame:
+        Computes one measure for every pair of the given variables, as a square matrix.
+    """
+
+    METRICS = (
+        "phi",
+        "contingency",
+        "cramers_v",
+        "cramers_v_corrected",
+        "lambda",
+        "theils_u",
+        "mutual_information",
+    )
+    # Measures whose value does not depend on which variable forms the rows of the table.
+    SYMMETRIC_METRICS = (
+        "phi",
+        "contingency",
+        "cramers_v",
+        "cramers_v_corrected",
+        "lambda",
+        "mutual_information",
+    )
+
+    __slots__ = ("_top_k",)
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        precomputed: Optional[ColumnProfile] = None,
+        top_k: Optional[int] = None,
+    ):
+        """
+        Initializes the BatchCategoricalAnalyzer instance.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The input data containing the variables.
+        precomputed : ColumnProfile, optional
+            Output of ``prepare`` for ``data``.
+        top_k : int, optional
+            If given, variables with more levels keep only their ``top_k`` most frequent
+            levels and pool the rest into an "Other" level. This bounds the table size for
+            high-cardinality variables, at the cost of approximate measures.
+        """
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k must be a positive integer.")
+        super().__init__(data, precomputed=precomputed)
+        self._top_k = top_k
+
+    def _codes(self, name: str) -> Tuple[np.ndarray, pd.Index]:
+        """
+        Returns the codes and levels of a variable, pooling rare levels beyond ``top_k``.
+
+        Parameters
+        ----------
+        name : str
+            The name of the variable.
+
+        Returns
+        -------
+        Tuple[np.ndarray, pd.Index]
+            The codes, -1 where the value is missing, and the levels.
+        """
+        if self._top_k is not None and name not in self._codes_cache:
+            codes, levels = super()._codes(name)
+            if len(levels) > self._top_k:
+                self._codes_cache[name] = _pool_rare_levels(codes, levels, self._top_k)
+        return super()._codes(name)
+
+    def analyze(
+        self, pairs: Sequence[Tuple[str, str]], metrics: Sequence[str] = METRICS
+    ) -> pd.DataFrame:
+        """
+        Computes association measures for each pair of nominal variables.
+
+        Parameters
+        ----------
+        pairs : Sequence[Tuple[str, str]]
+            The (a_name, b_name) pairs of variables to analyze.
+        metrics : Sequence[str], optional
+            The measures to compute, any of 'phi', 'contingency', 'cramers_v',
+            'cramers_v_corrected', 'lambda', 'theils_u' and 'mutual_information'. Defaults to
+            all of them.
 
-        # Compute Theil's U coefficient
-        u = 0
-        for x in p_x.index:
-            for y in p_y_given_x[x].index:
-                p_xy = p_y_given_x[x][y]
-                u += p_xy * np.log(p_xy / p_x[x])
+        Returns
+        -------
+        pd.DataFrame
+            One row per pair, indexed by the variable names, and one column per measure.
+            Phi is NaN for pairs whose contingency table is not 2x2, Cramer's V is NaN for
+            pairs where either variable has a single observed level, and every measure is
+            NaN for pairs without a complete observation.
 
-        return u
+        Raises
+        ------
+        ValueError
+            If a measure is not supported, or if a variable is not in the DataFrame or is
+            numeric.
+        """
+        unsupported = set(metrics) - set(self.METRICS)
+        if unsupported:
+            raise ValueError(f"Unsupported metrics: {sorted(unsupported)}.")
+        for a_name, b_name in pairs:
+            self.validate_input(a_name, b_name)
+
+        needs_chi2 = bool(
+            {"contingency", "cramers_v", "cramers_v_corrected", "lambda"} & set(metrics)
+        )
+        rows = [
+            self._measure(self._contingency(a_name, b_name), metrics, needs_chi2)
+            for a_name, b_name in pairs
+        ]
+
+        index = pd.MultiIndex.from_tuples(list(pairs), names=["a_name", "b_name"])
+        return pd.DataFrame(rows, index=index, columns=list(metrics), dtype=np.float64)
+
+    @staticmethod
+    def _measure(
+        contingency: Contingency, metrics: Sequence[str], needs_chi2: bool
+    ) -> List[float]:
+        """
+        Computes the requested measures from one contingency table.
+
+        Parameters
+        ----------
+        contingency : Contingency
+            The contingency table of the pair, as returned by ``_contingency``.
+        metrics : Sequence[str]
+            The measures to compute.
+        needs_chi2 : bool
+            Whether any of the measures needs the chi-squared statistic.
+
+        Returns
+        -------
+        List[float]
+            The measures, in the order of ``metrics``.
+        """
+        counts, _, _, n = contingency
+        r, k = counts.shape
+        shape = (r, k)
+        # Only read by the chi-squared based measures, so the placeholder is never used.
+        chi2 = _chi2(counts) if needs_chi2 else np.nan
+        measures: Dict[str, Callable[[], float]] = {
+            "phi": lambda: _phi(counts) if shape == (2, 2) else np.nan,
+            "contingency": lambda: _contingency_coefficient(chi2, n),
+            "cramers_v": lambda: _cramers_v(chi2, n, shape),
+            "cramers_v_corrected": lambda: _cramers_v_corrected(chi2, n, shape),
+            "lambda": lambda: _lambda_nominal(chi2, n, shape),
+            "theils_u": lambda: _theils_u(counts),
+            "mutual_information": lambda: _mutual_information(counts),
+        }
+        return [measures[metric]() for metric in metrics]
+
+    def pairwise(self, columns: Sequence[str], metric: str) -> pd.DataFrame:
+        """
+        Computes one association measure for every pair of the given nominal variables.
+
+        For symmetric measures only the upper triangle, diagonal included, is computed and
+        mirrored to the lower triangle.
+
+        Parameters
+        ----------
+        columns : Sequence[str]
+            The names of the variables.
+        metric : str
+            The measure to compute, one of ``METRICS``.
+
+        Returns
+        -------
+        pd.DataFrame
+            Square matrix indexed by ``columns`` on both axes, with the row variable as
+            ``a_name`` and the column variable as ``b_name``.
+
+        Raises
+        ------
+        ValueError
+            If the measure is not supported, or if a variable is not in the DataFrame or is
+            numeric.
+        """
+        symmetric = metric in self.SYMMETRIC_METRICS
+        pairs = [
+            (a_name, b_name)
+            for i, a_name in enumerate(columns)
+            for j, b_name in enumerate(columns)
+            if j >= i or not symmetric
+        ]
+        values = self.analyze(pairs=pairs, metrics=[metric])[metric]
+
+        position = {name: i for i, name in enumerate(columns)}
+        matrix = np.empty((len(columns), len(columns)), dtype=np.float64)
+        for (a_name, b_name), value in values.items():
+            matrix[position[a_name], position[b_name]] = value
+            if symmetric:
+                matrix[position[b_name], position[a_name]] = value
+        return pd.DataFrame(matrix, index=list(columns), columns=list(columns))
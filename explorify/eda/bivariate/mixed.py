@@ -17,9 +17,15 @@
 # Copyright  : (c) 2024 John James                                                                 #
 # ================================================================================================ #
 """Mixed Categorical / Numeric Bivariate Analyzer Module"""
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
-from explorify.eda.bivariate.base import BivariateCategoricalNumericAnalyzer
+from explorify.eda.bivariate.base import (
+    BivariateCategoricalNumericAnalyzer,
+    ColumnProfile,
+)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -30,8 +36,12 @@ class BivariateEffectSizeAnalyzer(BivariateCategoricalNumericAnalyzer):
     Computes the effect size (Eta squared) for the relationship between the categorical and numeric variables.
     """
 
-    def __init__(self, data: pd.DataFrame) -> None:
-        super().__init__(data=data)
+    __slots__ = ()
+
+    def __init__(
+        self, data: pd.DataFrame, precomputed: Optional[ColumnProfile] = None
+    ) -> None:
+        super().__init__(data=data, precomputed=precomputed)
 
     def analyze(self, a_name: str, b_name: str) -> float:
         """
@@ -44,17 +54,28 @@ class BivariateEffectSizeAnalyzer(BivariateCategoricalNumericAnalyzer):
         Returns:
             float: The Eta squared effect size.
 
+        Note:
+            Only observed categories form groups, so unused levels of a Categorical column
+            are ignored rather than making the result NaN.
+
         Example:
             >>> analysis = BivariateCategoricalNumericAnalyzer(data)
             >>> eta_sq = analysis.effect_size('Category', 'Value')
             >>> print(eta_sq)
         """
         self.validate_input(a_name=a_name, b_name=b_name)
-        group_means = self._data.groupby(a_name)[b_name].mean()
-        overall_mean = self._data[b_name].mean()
-        ss_between = sum(
-            self._data.groupby(a_name).size() * (group_means - overall_mean) ** 2
-        )
-        ss_total = sum((self._data[b_name] - overall_mean) ** 2)
+        codes, _ = self._data[a_name].factorize()
+        values = self._data[b_name].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # Group sizes and sums in one pass each over the codes, rather than per-group pandas
+        # reductions. Rows with a missing category are left out of the groups.
+        grouped = codes >= 0
+        group_codes, group_values = codes[grouped], values[grouped]
+        group_sizes = np.bincount(group_codes)
+        group_means = np.bincount(group_codes, weights=group_values) / group_sizes
+
+        overall_mean = values.mean()
+        ss_between = (group_sizes * (group_means - overall_mean) ** 2).sum()
+        ss_total = ((values - overall_mean) ** 2).sum()
         eta_squared = ss_between / ss_total
-        return eta_squared
+        return float(eta_squared)
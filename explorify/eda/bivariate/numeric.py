@@ -17,11 +17,11 @@
 # Copyright  : (c) 2024 John James                                                                 #
 # ================================================================================================ #
 """Numeric Bivariate Analyzer Module"""
-from typing import Type
+from typing import Optional, Type
 
 import pandas as pd
 
-from explorify.eda.bivariate.base import BivariateNumericAnalyzer
+from explorify.eda.bivariate.base import BivariateNumericAnalyzer, ColumnProfile
 from explorify.eda.regression.simple import (
     SimpleRegressionAnalyzer,
     SimpleRegressionResult,
@@ -41,6 +41,7 @@ class BivariateRegressionAnalyzer(BivariateNumericAnalyzer):
         data (pd.DataFrame): The input data containing the variables.
         visualizer (Visualizer): Visualizer instance for plotting.
         simple_linear_regression_cls (SimpleRegressionAnalyzer): Class for performing simple linear regression.
+        precomputed (ColumnProfile): Output of ``prepare`` for ``data``. Optional.
 
     Attributes:
         _visualizer (Visualizer): Visualizer instance for plotting.
@@ -48,14 +49,17 @@ class BivariateRegressionAnalyzer(BivariateNumericAnalyzer):
 
     """
 
+    __slots__ = ("_simple_linear_regression_cls",)
+
     def __init__(
         self,
         data: pd.DataFrame,
         simple_linear_regression_cls: Type[
             SimpleRegressionAnalyzer
         ] = SimpleRegressionAnalyzer,
+        precomputed: Optional[ColumnProfile] = None,
     ) -> None:
-        super().__init__(data=data)
+        super().__init__(data=data, precomputed=precomputed)
         self._simple_linear_regression_cls = simple_linear_regression_cls
 
     def analyze(self, a_name: str, b_name: str) -> SimpleRegressionResult:
@@ -20,7 +20,6 @@ from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
 
 from explorify.eda.regression.base import RegressionAnalyzer, RegressionResult
 
@@ -105,20 +104,19 @@ class SimpleRegressionAnalyzer(RegressionAnalyzer):
 
     def run(self) -> None:
         """Performs the statistical test and creates a result object."""
+        # Deferred: statsmodels is slow to import and only needed to fit a model.
+        import statsmodels.api as sm  # noqa: PLC0415
 
         result = sm.OLS(
             endog=self._data[self._b_name],
             exog=sm.add_constant(self._data[self._a_name]),
             **self._kwargs,
         ).fit()
-        restricted = sm.OLS(
-            endog=self._data[self._b_name],
-            exog=sm.add_constant(np.ones(len(self._data))),
-        ).fit()
-        f_test_result = result.compare_f_test(restricted)
-        fvalue = f_test_result[0]
-        pvalue = f_test_result[1]
-        df_num = f_test_result[2]
+        # The F test against the intercept-only model is the fit's overall F test, so the
+        # restricted model need not be fitted separately.
+        fvalue = result.fvalue
+        pvalue = result.f_pvalue
+        df_num = result.df_model
         df_den = result.df_resid
 
         # Create the result object.
@@ -274,9 +274,14 @@ class CramersVAnalyzer(StatAnalyzer):
 
         dof = min(crosstab.shape[0], crosstab.shape[1]) - 1
 
-        cv = stats.contingency.association(
-            crosstab.values, method="cramer", correction=self._correction
+        # Cramer's V reuses the (Yates-corrected) statistic above. Only an uncorrected V needs
+        # a second, uncorrected test, as the reported X² keeps scipy's default correction.
+        x2 = (
+            statistic
+            if self._correction
+            else stats.chi2_contingency(crosstab.values, correction=False)[0]
         )
+        cv = np.sqrt(x2 / (crosstab.values.sum() * dof))
 
         revised_dof = np.min(np.array([dof, 10]))
 
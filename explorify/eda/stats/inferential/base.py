@@ -22,11 +22,17 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, List
+
+import numpy as np
 
 from explorify import DataClass
 from explorify.eda.stats.inferential.profile import StatTestProfile
 from explorify.utils.io import IOService
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
@@ -70,6 +76,32 @@ class StatTestResult(DataClass):
             return "p=" + (str(round(pvalue, 3))).lstrip("0")
 
 
+# ------------------------------------------------------------------------------------------------ #
+def split_groups(by: pd.Series, values: pd.Series) -> List[np.ndarray]:
+    """Splits values into one array per observed level of a grouping variable.
+
+    Equivalent to ``[group.values for _, group in values.groupby(by, observed=True, sort=False)]``,
+    but the levels are factorized once and the values partitioned with a single stable sort.
+
+    Args:
+        by (pd.Series): The grouping variable. Rows where it is missing are left out.
+        values (pd.Series): The values to split, aligned with ``by``.
+
+    Returns:
+        List[np.ndarray]: The values of each level, in order of first appearance. Empty when
+            every value of ``by`` is missing.
+    """
+    codes, levels = by.factorize()
+    grouped = codes >= 0
+    codes, values = codes[grouped], values.to_numpy()[grouped]
+    if not len(codes):
+        # np.split would otherwise return a single empty group.
+        return []
+    order = np.argsort(codes, kind="stable")
+    bounds = np.bincount(codes, minlength=len(levels)).cumsum()[:-1]
+    return np.split(values[order], bounds)
+
+
 # ------------------------------------------------------------------------------------------------ #
 class StatisticalTest(ABC):
     """Base class for Statistical Tests"""
@@ -25,7 +25,11 @@ from scipy import stats
 
 from explorify.container import VisualizeContainer
 from explorify.eda.stats.descriptive.continuous import ContinuousStats
-from explorify.eda.stats.inferential.base import StatisticalTest, StatTestResult
+from explorify.eda.stats.inferential.base import (
+    StatisticalTest,
+    StatTestResult,
+    split_groups,
+)
 from explorify.eda.stats.inferential.profile import StatTestProfile
 from explorify.eda.visualize.visualizer import Visualizer
 
@@ -281,9 +285,7 @@ class AnovaOneWayTest(StatisticalTest):
     def run(self) -> None:
         """Executes the TTest."""
 
-        groups = [
-            group[self._b_name].values for _, group in self._data.groupby(self._a_name)
-        ]
+        groups = split_groups(self._data[self._a_name], self._data[self._b_name])
 
         statistic, pvalue = stats.f_oneway(*groups)
 
@@ -23,7 +23,11 @@ from dependency_injector.wiring import Provide, inject
 from scipy import stats
 
 from explorify.container import VisualizeContainer
-from explorify.eda.stats.inferential.base import StatisticalTest, StatTestResult
+from explorify.eda.stats.inferential.base import (
+    StatisticalTest,
+    StatTestResult,
+    split_groups,
+)
 from explorify.eda.stats.inferential.profile import StatTestProfile
 from explorify.eda.visualize.visualizer import Visualizer
 
@@ -124,9 +128,7 @@ class KruskalWallisHTest(StatisticalTest):
     def run(self) -> None:
         """Executes the Test."""
 
-        groups = [
-            group[self._a_name].values for _, group in self._data.groupby(self._b_name)
-        ]
+        groups = split_groups(self._data[self._b_name], self._data[self._a_name])
 
         statistic, pvalue = stats.kruskal(*groups)
 
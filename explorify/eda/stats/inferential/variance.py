@@ -23,7 +23,11 @@ from dependency_injector.wiring import Provide, inject
 from scipy import stats
 
 from explorify.container import VisualizeContainer
-from explorify.eda.stats.inferential.base import StatisticalTest, StatTestResult
+from explorify.eda.stats.inferential.base import (
+    StatisticalTest,
+    StatTestResult,
+    split_groups,
+)
 from explorify.eda.stats.inferential.profile import StatTestProfile
 from explorify.eda.visualize.visualizer import Visualizer
 
@@ -106,8 +110,7 @@ class LeveneTest(StatisticalTest):
         data_clean = self._data.dropna(subset=[self._a_name, self._b_name])[
             [self._a_name, self._b_name]
         ]
-        grouped_data = data_clean.groupby(self._a_name)[self._b_name]
-        groups = [group for _, group in grouped_data]
+        groups = split_groups(data_clean[self._a_name], data_clean[self._b_name])
 
         statistic, pvalue = stats.levene(*groups)
 
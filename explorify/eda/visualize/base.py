@@ -18,8 +18,10 @@
 # ================================================================================================ #
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Union
 
+import matplotlib as mpl
 import pandas as pd
 import seaborn as sns
 
@@ -57,6 +59,19 @@ class Canvas(DataClass):  # pragma: no
     """Namespace for Canvas subclasses"""
 
 
+# ------------------------------------------------------------------------------------------------ #
+@lru_cache(maxsize=None)
+def _style_rc(style: str) -> dict:
+    """Resolves a Seaborn aesthetic to its rcParams once per style name."""
+    return dict(sns.axes_style(style=style))
+
+
+def _apply_canvas(canvas: Canvas) -> None:
+    """Applies the canvas style and palette to matplotlib's global rcParams."""
+    mpl.rcParams.update(_style_rc(canvas.style))
+    sns.set_palette(palette=canvas.palette)
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                       VISUALIZER                                                 #
 # ------------------------------------------------------------------------------------------------ #
@@ -74,8 +89,7 @@ class Visualizer(ABC):  # pragma: no cover
         """Defines the construction requirement for Visualizers"""
         self._canvas = canvas
         self._data = None
-        sns.set_style(style=self._canvas.style)
-        sns.set_palette(palette=self._canvas.palette)
+        _apply_canvas(canvas=self._canvas)
 
     @property
     def data(self) -> pd.DataFrame:
@@ -92,8 +106,7 @@ class Visualizer(ABC):  # pragma: no cover
     @canvas.setter
     def canvas(self, canvas: Canvas) -> None:
         self._canvas = canvas
-        sns.set_style(style=canvas.style)
-        sns.set_palette(canvas.palette)
+        _apply_canvas(canvas=canvas)
 
     @abstractmethod
     def lineplot(self, *args, **kwargs) -> None:  # pragma: no cover
@@ -271,9 +271,9 @@ class PickleIO(IO):  # pragma: no cover
 
 class ParquetIO(IO):  # pragma: no cover
     @classmethod
-    def _read(cls, filepath: str, **kwargs) -> Any:
-        """Reads using pandas API."""
-        return pd.read_parquet(path=filepath)
+    def _read(cls, filepath: str, columns: List[str] = None, **kwargs) -> Any:
+        """Reads using pandas API. Only the requested columns are deserialized."""
+        return pd.read_parquet(path=filepath, columns=columns)
 
     @classmethod
     def _write(cls, filepath: str, data: pd.DataFrame, **kwargs) -> None:
@@ -281,6 +281,41 @@ class ParquetIO(IO):  # pragma: no cover
         data.to_parquet(path=filepath)
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                         FEATHER                                                  #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class FeatherIO(IO):  # pragma: no cover
+    @classmethod
+    def _read(cls, filepath: str, columns: List[str] = None, **kwargs) -> Any:
+        """Memory-maps an Arrow IPC (Feather v2) file and converts only the requested columns."""
+        # Imported on use, as pyarrow is an optional dependency (the 'feather' extra).
+        from pyarrow import feather  # noqa: PLC0415
+
+        table = feather.read_table(filepath, memory_map=True)
+        if columns is not None:
+            # Keep the stored index columns as well, as pd.read_parquet does. Selecting from a
+            # memory-mapped, uncompressed table copies none of the other columns.
+            metadata = table.schema.pandas_metadata or {}
+            index = [
+                name
+                for name in metadata.get("index_columns", [])
+                if isinstance(name, str)
+            ]
+            table = table.select([*columns, *index])
+        return table.to_pandas(split_blocks=True)
+
+    @classmethod
+    def _write(cls, filepath: str, data: pd.DataFrame, **kwargs) -> None:
+        """Writes an uncompressed Arrow IPC file so that reads can be memory-mapped."""
+        from pyarrow import feather  # noqa: PLC0415
+
+        # Written by pyarrow rather than DataFrame.to_feather, which older pandas versions
+        # reject for a non-default index. The index is kept, as ParquetIO does.
+        feather.write_feather(data, filepath, compression="uncompressed")
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                           HTML                                                   #
 # ------------------------------------------------------------------------------------------------ #
@@ -348,6 +383,8 @@ class IOService:  # pragma: no cover
         "xlsx": ExcelIO,
         "xls": ExcelIO,
         "parquet": ParquetIO,
+        "feather": FeatherIO,
+        "arrow": FeatherIO,
     }
     _logger = logging.getLogger(
         f"{__module__}.{__name__}",
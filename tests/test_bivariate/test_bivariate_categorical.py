@@ -20,10 +20,14 @@ import inspect
 import logging
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import pytest
+from scipy import stats
+from sklearn.metrics import mutual_info_score
 
 from explorify.eda.bivariate.categorical import (
+    BatchCategoricalAnalyzer,
     ContingencyCoefficientAnalyzer,
     ContingencyTableAnalyzer,
     GammaCoefficientAnalyzer,
@@ -43,6 +47,30 @@ double_line = f"\n{100 * '='}"
 single_line = f"\n{100 * '-'}"
 
 
+# ------------------------------------------------------------------------------------------------ #
+def _brute_force_gamma(
+    data: pd.DataFrame, a_name: str, b_name: str, ordinal: bool
+) -> float:
+    """Counts concordant and discordant pairs of complete rows one pair at a time."""
+    complete = data[[a_name, b_name]].dropna()
+    a, b = complete[a_name].tolist(), complete[b_name].tolist()
+    table = pd.crosstab(complete[a_name], complete[b_name])
+    concordant = discordant = 0
+    for i in range(len(a)):
+        for j in range(i + 1, len(a)):
+            if a[i] == a[j] or (ordinal and b[i] == b[j]):
+                continue
+            if ordinal:
+                agree = (a[i] < a[j]) == (b[i] < b[j])
+            else:
+                # The cross-cell rule: the pair is ordered by the counts at its crossed cells.
+                lower, upper = (i, j) if a[i] < a[j] else (j, i)
+                agree = table.loc[a[upper], b[lower]] > table.loc[a[lower], b[upper]]
+            concordant += agree
+            discordant += not agree
+    return (concordant - discordant) / (concordant + discordant)
+
+
 @pytest.mark.bivariate
 @pytest.mark.category
 class TestBivariateCategoricalAnalyzer:  # pragma: no cover
@@ -232,6 +260,48 @@ class TestBivariateCategoricalAnalyzer:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    @pytest.mark.parametrize("missing", [False, True])
+    def test_gamma_coefficient_pair_count(self, missing, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(7)
+        data = pd.DataFrame(
+            {
+                "income": rng.choice(["0_low", "1_mid", "2_high"], size=40),
+                "rating": rng.choice(["0_poor", "1_fair", "2_good", "3_best"], size=40),
+                "region": rng.choice(["east", "north", "west"], size=40),
+            }
+        )
+        if missing:
+            # Rows missing either variable are left out of the pair counts.
+            data.loc[[3, 11, 20], "income"] = None
+            data.loc[[5, 11, 33], "rating"] = None
+            data.loc[[7, 29], "region"] = None
+        analysis = GammaCoefficientAnalyzer(data=data)
+        ordinal = analysis.analyze(
+            a_name="income", b_name="rating", a_type="ordinal", b_type="ordinal"
+        )
+        assert ordinal == pytest.approx(
+            _brute_force_gamma(data, "income", "rating", ordinal=True)
+        )
+        mixed = analysis.analyze(a_name="income", b_name="region")
+        assert mixed == pytest.approx(
+            _brute_force_gamma(data, "income", "region", ordinal=False)
+        )
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_lambda_coefficient_ordinal(self, credit, caplog):
         start = datetime.now()
@@ -390,6 +460,37 @@ class TestBivariateCategoricalAnalyzer:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    @pytest.mark.parametrize("correction", [True, False])
+    def test_phi_coefficient_correction(self, correction, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        table = np.array([[12, 5], [4, 9]])
+        data = pd.DataFrame(
+            {
+                "a": ["x"] * 17 + ["y"] * 13,
+                "b": ["u"] * 12 + ["v"] * 5 + ["u"] * 4 + ["v"] * 9,
+            }
+        )
+        chi2 = stats.chi2_contingency(table, correction=correction)[0]
+        expected = np.sqrt(chi2 / table.sum())
+
+        analysis = PhiCoefficientAnalyzer(data=data)
+        result = analysis.analyze(a_name="a", b_name="b", correction=correction)
+        assert result == pytest.approx(expected)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_thiels_u_coefficient(self, credit, caplog):
         start = datetime.now()
@@ -401,6 +502,225 @@ class TestBivariateCategoricalAnalyzer:  # pragma: no cover
         analysis = ThielsUCoefficientAnalyzer(data=credit)
         result = analysis.analyze(a_name="Education", b_name="Own")
         assert isinstance(result, float)
+        assert 0 <= result <= 1
+        logger.info(result)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_batch_analysis(self, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = pd.DataFrame(
+            {
+                "gender": list("mfmfmmffmfmf"),
+                "own": list("yynnyynnnyyy"),
+                "education": list("hhcgcghhcggc"),
+            }
+        )
+        pairs = [("gender", "own"), ("gender", "education")]
+        analysis = BatchCategoricalAnalyzer(data=data)
+        result = analysis.analyze(pairs=pairs)
+        assert result.shape == (2, len(BatchCategoricalAnalyzer.METRICS))
+
+        for a_name, b_name in pairs:
+            table = pd.crosstab(data[a_name], data[b_name]).to_numpy()
+            n = table.sum()
+            chi2 = stats.chi2_contingency(table)[0]
+            dim = min(table.shape) - 1
+            mi = mutual_info_score(data[a_name], data[b_name])
+            p_b = table.sum(axis=0) / n
+            row = result.loc[(a_name, b_name)]
+            assert row["contingency"] == pytest.approx(np.sqrt(chi2 / (chi2 + n)))
+            assert row["cramers_v"] == pytest.approx(np.sqrt(chi2 / (n * dim)))
+            assert row["lambda"] == pytest.approx(
+                np.sqrt(chi2 / (n * min(table.shape)))
+            )
+            assert row["mutual_information"] == pytest.approx(mi)
+            assert row["theils_u"] == pytest.approx(mi / -(p_b * np.log(p_b)).sum())
+        # Phi is only defined for the 2x2 table.
+        assert result.loc[("gender", "own"), "phi"] == pytest.approx(
+            np.sqrt(stats.chi2_contingency(pd.crosstab(data.gender, data.own))[0] / 12)
+        )
+        assert np.isnan(result.loc[("gender", "education"), "phi"])
+        with pytest.raises(ValueError):
+            analysis.analyze(pairs=pairs, metrics=["bogus"])
+        logger.info(result)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_batch_pairwise(self, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = pd.DataFrame(
+            {
+                "gender": list("mfmfmmffmfmf"),
+                "own": list("yynnyynnnyyy"),
+                "education": list("hhcgcghhcggc"),
+            }
+        )
+        columns = ["gender", "own", "education"]
+        analysis = BatchCategoricalAnalyzer(data=data)
+        result = analysis.pairwise(columns=columns, metric="contingency")
+        assert result.shape == (3, 3)
+        assert list(result.index) == columns and list(result.columns) == columns
+        np.testing.assert_array_equal(result.to_numpy(), result.to_numpy().T)
+        assert result.loc["gender", "education"] == pytest.approx(
+            ContingencyCoefficientAnalyzer(data).analyze("gender", "education")
+        )
+
+        # Theil's U is asymmetric, so both orders of each pair are computed.
+        theils_u = analysis.pairwise(columns=columns, metric="theils_u")
+        for a_name in columns:
+            for b_name in columns:
+                assert theils_u.loc[a_name, b_name] == pytest.approx(
+                    ThielsUCoefficientAnalyzer(data).analyze(a_name, b_name)
+                )
+        assert theils_u.loc["gender", "education"] != pytest.approx(
+            theils_u.loc["education", "gender"]
+        )
+        logger.info(result)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_batch_top_k(self, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # A real level named "Other" is among the two most frequent, so the pooled levels
+        # c and d must form a level of their own rather than merge with it.
+        levels = ["Other"] * 5 + ["b"] * 4 + ["c"] * 2 + ["d"] * 2
+        data = pd.DataFrame(
+            {
+                "level": levels,
+                "pooled": ["Other"] * 5 + ["b"] * 4 + ["Other (pooled)"] * 4,
+                "target": list("xyxyxxyyxyxyx"),
+            }
+        )
+        metrics = list(BatchCategoricalAnalyzer.SYMMETRIC_METRICS)
+        result = BatchCategoricalAnalyzer(data=data, top_k=2).analyze(
+            pairs=[("level", "target")], metrics=metrics
+        )
+        expected = BatchCategoricalAnalyzer(data=data).analyze(
+            pairs=[("pooled", "target")], metrics=metrics
+        )
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+        # Variables with at most top_k levels are left as they are.
+        unpooled = BatchCategoricalAnalyzer(data=data, top_k=3).analyze(
+            pairs=[("pooled", "target")], metrics=metrics
+        )
+        np.testing.assert_allclose(unpooled.to_numpy(), expected.to_numpy())
+        logger.info(result)
+        with pytest.raises(ValueError):
+            BatchCategoricalAnalyzer(data=data, top_k=0)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_batch_empty_table(self, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = pd.DataFrame(
+            {
+                "color": ["red", "blue", "red", "blue"],
+                "missing": pd.Series([None] * 4, dtype=object),
+            }
+        )
+        analysis = BatchCategoricalAnalyzer(data=data)
+        result = analysis.analyze(pairs=[("color", "missing"), ("missing", "color")])
+        assert result.shape == (2, len(BatchCategoricalAnalyzer.METRICS))
+        assert result.isna().all().all()
+        # The single-pair analyzers share the same helpers, so they give NaN as well.
+        assert np.isnan(ThielsUCoefficientAnalyzer(data).analyze("color", "missing"))
+        assert np.isnan(MutualInformationAnalyzer(data).analyze("color", "missing"))
+        assert np.isnan(
+            ContingencyCoefficientAnalyzer(data).analyze("color", "missing")
+        )
+        lambda_analysis = LambdaCoefficientAnalyzer(data)
+        assert np.isnan(lambda_analysis.analyze("color", "missing"))
+        assert np.isnan(lambda_analysis.analyze("color", "missing", a_type="ordinal"))
+        logger.info(result)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_batch_cramers_v_corrected(self, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Table [[10, 5, 5], [5, 10, 5]]: n = 40 and chi2 = 10 / 3, so phi2 = 1 / 12.
+        # Bergsma: phi2 - (r - 1)(k - 1) / (n - 1) = 5 / 156, r~ = 2 - 1 / 39 and
+        # k~ = 3 - 4 / 39, so V = sqrt((5 / 156) / (min(r~, k~) - 1)) = sqrt(5 / 152).
+        data = pd.DataFrame(
+            {
+                "row": ["p"] * 20 + ["q"] * 20,
+                "col": ["r"] * 10
+                + ["s"] * 5
+                + ["t"] * 5
+                + ["r"] * 5
+                + ["s"] * 10
+                + ["t"] * 5,
+            }
+        )
+        analysis = BatchCategoricalAnalyzer(data=data)
+        result = analysis.analyze(
+            pairs=[("row", "col")], metrics=["cramers_v", "cramers_v_corrected"]
+        )
+        assert result.loc[("row", "col"), "cramers_v"] == pytest.approx((1 / 12) ** 0.5)
+        assert result.loc[("row", "col"), "cramers_v_corrected"] == pytest.approx(
+            (5 / 152) ** 0.5
+        )
         logger.info(result)
         # ---------------------------------------------------------------------------------------- #
         end = datetime.now()
@@ -20,6 +20,8 @@ import inspect
 import logging
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from explorify.eda.bivariate.mixed import BivariateEffectSizeAnalyzer
@@ -57,3 +59,37 @@ class TestBivariateCategoricalNumericalAnalyzer:  # pragma: no cover
             f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_effect_size_formula(self, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        group = pd.Categorical(
+            ["a", "b", None, "a", "c", "b", "c", "a"],
+            categories=["a", "b", "c", "unused"],
+        )
+        data = pd.DataFrame(
+            {"group": group, "value": [1.0, 4.0, 2.5, 2.0, 7.0, 5.0, 6.0, 3.0]}
+        )
+        # SSB over the observed groups, SST over every row, both about the overall mean.
+        overall_mean = data["value"].mean()
+        grouped = data.groupby("group", observed=True)["value"]
+        ss_between = (grouped.size() * (grouped.mean() - overall_mean) ** 2).sum()
+        ss_total = ((data["value"] - overall_mean) ** 2).sum()
+
+        analysis = BivariateEffectSizeAnalyzer(data=data)
+        result = analysis.analyze(a_name="group", b_name="value")
+        assert np.isfinite(result)
+        assert result == pytest.approx(ss_between / ss_total)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -20,10 +20,16 @@ import inspect
 import logging
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
 import pytest
+import statsmodels.api as sm
 
 from explorify.eda.bivariate.numeric import BivariateRegressionAnalyzer
-from explorify.eda.regression.simple import SimpleRegressionResult
+from explorify.eda.regression.simple import (
+    SimpleRegressionAnalyzer,
+    SimpleRegressionResult,
+)
 
 # ------------------------------------------------------------------------------------------------ #
 # pylint: disable=missing-class-docstring, line-too-long
@@ -85,6 +91,40 @@ class TestBivariateNumericAnalyzer:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    def test_regression_f_test(self, caplog):
+        caplog.set_level(logging.INFO)
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(42)
+        x = rng.normal(size=50)
+        y = 0.3 * x + rng.normal(size=50)
+        data = pd.DataFrame({"x": x, "y": y})
+        # The overall F test of the fit must match comparing it to an intercept-only model.
+        full = sm.OLS(y, sm.add_constant(x)).fit()
+        restricted = sm.OLS(y, np.ones_like(y)).fit()
+        fvalue, pvalue, df_num = full.compare_f_test(restricted)
+
+        analyzer = SimpleRegressionAnalyzer(data=data, a_name="x", b_name="y")
+        analyzer.run()
+        result = analyzer.result
+        assert result.fvalue == pytest.approx(fvalue)
+        assert result.pvalue == pytest.approx(pvalue)
+        assert result.df_num == df_num
+        assert result.df_den == full.df_resid
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_plot_regression(self, plt, reviews, caplog):
         caplog.set_level(logging.INFO)
@@ -139,6 +139,46 @@ class TestMultivariateAnalyzer:  # pragma: no cover
         )
         logger.info(single_line)
 
+    # ============================================================================================ #
+    @pytest.mark.parametrize("case", ["clean", "nan", "inf", "float32"])
+    def test_correlation_fast_path(self, case, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = pd.DataFrame(
+            {
+                "a": [1.0, 2.0, 3.0, 4.0, 5.0],
+                "b": [2.0, 1.0, 4.0, 3.0, 6.0],
+                "c": [5.0, 3.0, 4.0, 1.0, 2.0],
+                "label": list("vwxyz"),
+            }
+        )
+        dtype = np.float64
+        if case == "nan":
+            data.loc[1, "a"] = np.nan
+        elif case == "inf":
+            data.loc[1, "a"] = np.inf
+        elif case == "float32":
+            dtype = np.float32
+
+        result = CorrelationAnalyzer(data=data).analyze(dtype=dtype)
+        expected = data.corr(numeric_only=True)
+        pd.testing.assert_frame_equal(
+            result, expected, rtol=1e-6 if dtype is np.float32 else 1e-12
+        )
+        logger.info(f"\nCorrelation Analyzer ({case}): \n{result}")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
     # ============================================================================================ #
     def test_correlation_analysis_plot(self, reviews, caplog):
         start = datetime.now()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Explorify                                                                           #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_stats/test_inferential/test_split_groups.py                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/explorify                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 06:45:00 pm                                                #
+# Modified   : Friday October 16th 2026 06:45:00 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from explorify.eda.stats.inferential.base import split_groups
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.stats
+class TestSplitGroups:  # pragma: no cover
+    # ============================================================================================ #
+    def test_unused_categories_and_missing_keys(self, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        by = pd.Series(
+            pd.Categorical(
+                ["b", "a", None, "b", "a", "b", None, "a"],
+                categories=["a", "b", "unused"],
+            )
+        )
+        values = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0])
+
+        groups = split_groups(by, values)
+
+        # One group per observed level, in order of first appearance; missing keys are dropped.
+        assert len(groups) == 2
+        np.testing.assert_array_equal(groups[0], [1.0, 4.0, 6.0])
+        np.testing.assert_array_equal(groups[1], [2.0, 5.0, 8.0])
+        expected = [
+            g.to_numpy() for _, g in values.groupby(by, observed=True, sort=False)
+        ]
+        for group, other in zip(groups, expected):
+            np.testing.assert_array_equal(group, other)
+
+        # No empty group for the unused category, so the k-sample statistics stay finite.
+        assert np.isfinite(stats.f_oneway(*groups).statistic)
+        assert np.isfinite(stats.kruskal(*groups).statistic)
+        assert np.isfinite(stats.levene(*groups).statistic)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_all_keys_missing(self, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        by = pd.Series([None, None, None], dtype=object)
+        values = pd.Series([1.0, 2.0, 3.0])
+        assert split_groups(by, values) == []
+        assert split_groups(by.iloc[:0], values.iloc[:0]) == []
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
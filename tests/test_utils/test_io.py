@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Explorify                                                                           #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.12                                                                             #
+# Filename   : /tests/test_utils/test_io.py                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/explorify                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 06:40:00 pm                                                #
+# Modified   : Friday October 16th 2026 06:40:00 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from explorify.utils.io import IOService
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# ------------------------------------------------------------------------------------------------ #
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.io
+class TestFeatherIO:  # pragma: no cover
+    # ============================================================================================ #
+    @pytest.mark.parametrize("extension", ["feather", "arrow"])
+    def test_round_trip(self, extension, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        pytest.importorskip("pyarrow")
+        data = pd.DataFrame(
+            {
+                "count": [1, 2, 3],
+                "score": [0.5, 1.5, 2.5],
+                "label": ["a", "b", "c"],
+            }
+        )
+        filepath = str(tmp_path / f"data.{extension}")
+        IOService.write(filepath=filepath, data=data)
+
+        pd.testing.assert_frame_equal(IOService.read(filepath=filepath), data)
+        pd.testing.assert_frame_equal(
+            IOService.read(filepath=filepath, columns=["label", "count"]),
+            data[["label", "count"]],
+        )
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_round_trip_index(self, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        pytest.importorskip("pyarrow")
+        data = pd.DataFrame(
+            {"count": [1, 2, 3], "label": ["a", "b", "c"]},
+            index=pd.Index(["x", "y", "z"], name="key"),
+        )
+        filepath = str(tmp_path / "data.feather")
+        IOService.write(filepath=filepath, data=data)
+
+        pd.testing.assert_frame_equal(IOService.read(filepath=filepath), data)
+        pd.testing.assert_frame_equal(
+            IOService.read(filepath=filepath, columns=["label"]), data[["label"]]
+        )
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)